@@ -2,26 +2,54 @@
 
 import os
 import logging
+from dataclasses import dataclass
+from typing import Optional
 from src.api_client import APIClient
+from src.async_api_client import AsyncAPIClient
 from src.cache_manager import CacheManager
 from src.cli import CLI
 
-# load simple env config if present
-from dotenv import load_dotenv
-load_dotenv()  # reads .env or config.env if present
+ENV_FILES = (".env", "config.env")
+# env files live next to this script, whatever the current directory is
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 
-LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
-CACHE_DIR = os.getenv("CACHE_DIR", "cache")
-CACHE_TTL = int(os.getenv("CACHE_TTL", "300"))
-API_BASE = os.getenv("API_BASE", "https://jsonplaceholder.typicode.com")
-
-logging.basicConfig(level=getattr(logging, LOG_LEVEL.upper(), logging.INFO), format="%(levelname)s:%(name)s:%(message)s")
 logger = logging.getLogger(__name__)
 
-def main():
-    api_client = APIClient(base_url=API_BASE, timeout=10, max_retries=3)
-    cache_manager = CacheManager(cache_dir=CACHE_DIR, ttl_seconds=CACHE_TTL)
-    cli = CLI(api_client=api_client, cache_manager=cache_manager)
+
+@dataclass(frozen=True)
+class AppConfig:
+    """Application settings, read once from the environment."""
+
+    log_level: str = "INFO"
+    cache_dir: str = "cache"
+    cache_ttl: int = 300
+    api_base: str = "https://jsonplaceholder.typicode.com"
+
+    @classmethod
+    def from_env(cls, base_dir: str = BASE_DIR) -> "AppConfig":
+        # only pay for python-dotenv when there is a file to parse
+        env_files = [os.path.join(base_dir, name) for name in ENV_FILES]
+        env_files = [path for path in env_files if os.path.exists(path)]
+        if env_files:
+            from dotenv import load_dotenv
+            for path in env_files:
+                load_dotenv(path)
+        env = os.environ
+        return cls(
+            log_level=env.get("LOG_LEVEL", cls.log_level),
+            cache_dir=env.get("CACHE_DIR", cls.cache_dir),
+            cache_ttl=int(env.get("CACHE_TTL", cls.cache_ttl)),
+            api_base=env.get("API_BASE", cls.api_base),
+        )
+
+
+def main(config: Optional[AppConfig] = None) -> int:
+    config = config or AppConfig.from_env()
+    logging.basicConfig(level=getattr(logging, config.log_level.upper(), logging.INFO), format="%(levelname)s:%(name)s:%(message)s")
+    api_client = APIClient(base_url=config.api_base, timeout=10, max_retries=3)
+    cache_manager = CacheManager(cache_dir=config.cache_dir, ttl_seconds=config.cache_ttl)
+    async_client = AsyncAPIClient(base_url=config.api_base, timeout=10, max_retries=3)
+    cli = CLI(api_client=api_client, cache_manager=cache_manager, async_client=async_client)
     exit_code = cli.run()
     return exit_code
 
@@ -1 +1 @@
-__all__ = ["api_client", "cache_manager", "data_filter", "cli", "utils"]
+__all__ = ["api_client", "async_api_client", "cache_manager", "data_filter", "cli", "utils"]
@@ -1,7 +1,14 @@
 """API client for JSONPlaceholder with robust error handling, retries, and validation."""
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple, Union
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import HTTPError as URLLib3HTTPError
+from urllib3.util.retry import Retry
+import ijson
+import orjson
+import itertools
+import random
 import time
 import logging
 
@@ -9,11 +16,59 @@ from .utils import timer
 
 LOGGER = logging.getLogger(__name__)
 
+# bodies below this size are buffered and parsed in one go (orjson); larger/unknown ones are streamed
+STREAM_THRESHOLD = 64 * 1024
+
+# transient server errors worth retrying
+RETRY_STATUSES = (500, 502, 503, 504)
+
 
 class APIClientError(Exception):
     """Base class for API client exceptions."""
 
 
+class NotModified(Exception):
+    """Raised on 304 Not Modified: the caller's cached copy is still current."""
+
+
+def validators_from_headers(headers: Any) -> Dict[str, str]:
+    """Extract ETag/Last-Modified response headers for later conditional requests."""
+    validators = {}
+    etag = headers.get("ETag")
+    if etag:
+        validators["etag"] = etag
+    last_modified = headers.get("Last-Modified")
+    if last_modified:
+        validators["last_modified"] = last_modified
+    return validators
+
+
+def full_jitter_backoff(retry_number: int, backoff_factor: float, backoff_cap: float) -> float:
+    """Return random.uniform(0, min(cap, backoff_factor * 2 ** (retry_number - 1))) for retry 1, 2, ..."""
+    return random.uniform(0, min(backoff_cap, backoff_factor * (2 ** (retry_number - 1))))
+
+
+class FullJitterRetry(Retry):
+    """Retry policy using "full jitter" backoff so concurrent clients do not retry in lockstep."""
+
+    def __init__(self, *args: Any, backoff_cap: float = 30.0, **kwargs: Any) -> None:
+        self.backoff_cap = backoff_cap
+        super().__init__(*args, **kwargs)
+
+    def new(self, **kw: Any) -> "FullJitterRetry":
+        # Retry.increment() clones via new(); carry the cap along
+        retry = super().new(**kw)
+        retry.backoff_cap = self.backoff_cap
+        return retry
+
+    def get_backoff_time(self) -> float:
+        """Return the jittered wait before the next retry (see full_jitter_backoff)."""
+        consecutive_errors = len(list(itertools.takewhile(lambda h: h.redirect_location is None, reversed(self.history))))
+        if consecutive_errors == 0:
+            return 0
+        return full_jitter_backoff(consecutive_errors, self.backoff_factor, self.backoff_cap)
+
+
 class APIClient:
     """Simple API client for JSONPlaceholder."""
 
@@ -23,72 +78,154 @@ class APIClient:
         timeout: int = 10,
         max_retries: int = 3,
         backoff_factor: float = 0.5,
+        pool_connections: int = 4,
+        pool_maxsize: int = 16,
+        backoff_cap: float = 30.0,
     ) -> None:
         """
         Initialize API client.
         :param base_url: Base API URL
         :param timeout: Request timeout in seconds
-        :param max_retries: Number of retry attempts on network errors
+        :param max_retries: Number of retry attempts on network and 5xx errors
         :param backoff_factor: Exponential backoff multiplier
+        :param pool_connections: Number of host connection pools to keep
+        :param pool_maxsize: Max keep-alive connections per host pool
+        :param backoff_cap: Upper bound in seconds for a single backoff wait
         """
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
         self.max_retries = max_retries
         self.backoff_factor = backoff_factor
+        self.backoff_cap = backoff_cap
         self.session = requests.Session()
+        # retries happen at the connection layer; pooled keep-alive skips repeat TLS handshakes
+        retry = FullJitterRetry(
+            total=max_retries,
+            backoff_factor=backoff_factor,
+            backoff_cap=backoff_cap,
+            status_forcelist=list(RETRY_STATUSES),
+            allowed_methods=["GET"],
+        )
+        adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, max_retries=retry)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update({"Accept": "application/json", "Connection": "keep-alive"})
+        # last seen cache validators per endpoint: {"posts": {"etag": ..., "last_modified": ...}}
+        self.validators: Dict[str, Dict[str, str]] = {}
         LOGGER.debug("APIClient initialized with base_url=%s", self.base_url)
 
-    def _request(self, path: str) -> List[Dict[str, Any]]:
-        """Internal request with retries and JSON validation."""
+    def _request(
+        self,
+        path: str,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+        with_raw: bool = False,
+    ) -> Union[List[Dict[str, Any]], Tuple[List[Dict[str, Any]], Optional[bytes]]]:
+        """Internal request with JSON validation. Retries are handled by the mounted adapter.
+
+        Passing ``etag``/``last_modified`` makes the request conditional; a 304 raises NotModified.
+        With ``with_raw`` returns ``(data, raw_bytes)``; raw_bytes is None for streamed bodies.
+        """
+        raw: Optional[bytes] = None
         url = f"{self.base_url}/{path.lstrip('/')}"
-        last_exc: Optional[Exception] = None
-        for attempt in range(1, self.max_retries + 1):
-            try:
-                LOGGER.debug("Requesting %s (attempt %d)", url, attempt)
-                start = time.time()
-                resp = self.session.get(url, timeout=self.timeout)
-                elapsed = time.time() - start
-                LOGGER.info("GET %s -> %s (%s)", url, resp.status_code, f"{elapsed:.3f}s")
-                if resp.status_code >= 500:
-                    # Server error - may retry
-                    raise APIClientError(f"Server error: {resp.status_code}")
-                if resp.status_code >= 400:
-                    # Client error - do not retry
-                    raise APIClientError(f"Client error: {resp.status_code} - {resp.text}")
+        headers = {}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+        LOGGER.debug("Requesting %s", url)
+        # only pay for timing when the INFO line will actually be emitted
+        timed = LOGGER.isEnabledFor(logging.INFO)
+        try:
+            if timed:
+                start = time.perf_counter()
+            resp = self.session.get(url, timeout=self.timeout, stream=True, headers=headers)
+        except requests.RequestException as e:
+            # timeouts, connection errors and RetryError (5xx after the retry budget is spent)
+            LOGGER.critical("All retries failed for %s: %s", url, e)
+            raise APIClientError(f"Failed to fetch {url}") from e
+        if timed:
+            LOGGER.info("GET %s -> %s (%.3fs)", url, resp.status_code, time.perf_counter() - start)
+        try:
+            if resp.status_code == 304:
+                raise NotModified(url)
+            if resp.status_code >= 500:
+                raise APIClientError(f"Server error: {resp.status_code}")
+            if resp.status_code >= 400:
+                # Client error - not retried
+                raise APIClientError(f"Client error: {resp.status_code} - {resp.text}")
+            if self._is_small(resp):
+                try:
+                    # with stream=True the body is only read here, outside session.get
+                    raw = resp.content
+                except requests.RequestException as e:
+                    raise APIClientError(f"Failed to read response body: {e}") from e
                 try:
-                    data = resp.json()
+                    # orjson.JSONDecodeError subclasses ValueError
+                    data = orjson.loads(raw)
                 except ValueError as e:
                     raise APIClientError("Invalid JSON response") from e
-                if not isinstance(data, list):
-                    # JSONPlaceholder returns list for these endpoints - validate basic shape
-                    raise APIClientError("Unexpected JSON shape - expected list")
-                # Basic data validation (non-empty list acceptable)
-                LOGGER.debug("Received %d items from %s", len(data), url)
-                return data
-            except (requests.Timeout, requests.ConnectionError) as e:
-                last_exc = e
-                wait = self.backoff_factor * (2 ** (attempt - 1))
-                LOGGER.warning("Network error on attempt %d: %s; retrying after %.2fs", attempt, e, wait)
-                time.sleep(wait)
-            except APIClientError as e:
-                # For client errors (4xx) or parsing issues, don't retry further
-                LOGGER.error("API client error: %s", e)
-                raise
-            except Exception as e:
-                last_exc = e
-                LOGGER.exception("Unexpected error during request")
-                wait = self.backoff_factor * (2 ** (attempt - 1))
-                time.sleep(wait)
-        # if we get here, all retries failed
-        LOGGER.critical("All retries failed for %s", url)
-        raise APIClientError(f"Failed to fetch {url}") from last_exc
-
-    def fetch_posts(self) -> List[Dict[str, Any]]:
+            else:
+                data = self._parse_stream(resp)
+            if not isinstance(data, list):
+                # JSONPlaceholder returns list for these endpoints - validate basic shape
+                raise APIClientError("Unexpected JSON shape - expected list")
+        except APIClientError as e:
+            LOGGER.error("API client error: %s", e)
+            raise
+        finally:
+            resp.close()
+        # Basic data validation (non-empty list acceptable)
+        LOGGER.debug("Received %d items from %s", len(data), url)
+        self.validators[path.strip("/")] = validators_from_headers(resp.headers)
+        if with_raw:
+            return data, raw
+        return data
+
+    @staticmethod
+    def _is_small(resp: requests.Response) -> bool:
+        """True when the declared body size is below STREAM_THRESHOLD.
+
+        Content-Length is the on-the-wire size, so encoded (e.g. gzip) bodies are always streamed.
+        """
+        if resp.headers.get("Content-Encoding", "identity").lower() != "identity":
+            return False
+        try:
+            return int(resp.headers.get("Content-Length", "")) < STREAM_THRESHOLD
+        except (TypeError, ValueError):
+            return False
+
+    @staticmethod
+    def _parse_stream(resp: requests.Response) -> List[Dict[str, Any]]:
+        """Incrementally parse a top-level JSON array from the raw socket stream."""
+        resp.raw.decode_content = True
+        try:
+            events = ijson.parse(resp.raw, use_float=True)
+            first = next(events, None)
+            if first is None or first[1] != "start_array":
+                raise APIClientError("Unexpected JSON shape - expected list")
+            return list(ijson.items(itertools.chain([first], events), "item"))
+        except (ValueError, ijson.JSONError) as e:
+            raise APIClientError("Invalid JSON response") from e
+        except URLLib3HTTPError as e:
+            raise APIClientError(f"Failed to read response body: {e}") from e
+
+    def fetch_posts(
+        self,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+        with_raw: bool = False,
+    ) -> Union[List[Dict[str, Any]], Tuple[List[Dict[str, Any]], Optional[bytes]]]:
         """Fetch posts from /posts endpoint."""
         with timer("fetch_posts"):
-            return self._request("/posts")
+            return self._request("/posts", etag=etag, last_modified=last_modified, with_raw=with_raw)
 
-    def fetch_users(self) -> List[Dict[str, Any]]:
+    def fetch_users(
+        self,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+        with_raw: bool = False,
+    ) -> Union[List[Dict[str, Any]], Tuple[List[Dict[str, Any]], Optional[bytes]]]:
         """Fetch users from /users endpoint."""
         with timer("fetch_users"):
-            return self._request("/users")
+            return self._request("/users", etag=etag, last_modified=last_modified, with_raw=with_raw)
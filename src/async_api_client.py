@@ -0,0 +1,152 @@
+"""Async API client for JSONPlaceholder: batches several GETs over one pooled aiohttp session."""
+
+from typing import List, Dict, Any, Optional, Sequence, Tuple, Union
+import asyncio
+import logging
+
+import aiohttp
+import orjson
+
+from .api_client import (
+    APIClientError,
+    NotModified,
+    RETRY_STATUSES,
+    full_jitter_backoff,
+    validators_from_headers,
+)
+
+LOGGER = logging.getLogger(__name__)
+
+
+class _RetryableError(Exception):
+    """Internal: a transient failure that should be retried."""
+
+
+class AsyncAPIClient:
+    """Asyncio counterpart of APIClient for fetching several endpoints concurrently."""
+
+    def __init__(
+        self,
+        base_url: str = "https://jsonplaceholder.typicode.com",
+        timeout: int = 10,
+        max_retries: int = 3,
+        backoff_factor: float = 0.5,
+        backoff_cap: float = 30.0,
+        limit: int = 32,
+        keepalive_timeout: int = 60,
+    ) -> None:
+        """
+        Initialize async API client.
+        :param base_url: Base API URL
+        :param timeout: Total request timeout in seconds
+        :param max_retries: Number of retry attempts on network and 5xx errors
+        :param backoff_factor: Exponential backoff multiplier
+        :param backoff_cap: Upper bound in seconds for a single backoff wait
+        :param limit: Max simultaneous connections in the pool
+        :param keepalive_timeout: Seconds to keep idle connections open
+        """
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.backoff_cap = backoff_cap
+        self.limit = limit
+        self.keepalive_timeout = keepalive_timeout
+        self._session: Optional[aiohttp.ClientSession] = None
+        # last seen cache validators per endpoint, same shape as APIClient.validators
+        self.validators: Dict[str, Dict[str, str]] = {}
+        LOGGER.debug("AsyncAPIClient initialized with base_url=%s", self.base_url)
+
+    async def __aenter__(self) -> "AsyncAPIClient":
+        # the session must be created inside the running event loop
+        if self._session is None:
+            connector = aiohttp.TCPConnector(limit=self.limit, keepalive_timeout=self.keepalive_timeout)
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                headers={"Accept": "application/json"},
+            )
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the underlying session, if open."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def _request_once(self, url: str, headers: Dict[str, str]) -> Tuple[List[Dict[str, Any]], bytes, Dict[str, str]]:
+        """Single GET attempt. Transient failures raise _RetryableError."""
+        try:
+            async with self._session.get(url, headers=headers) as resp:
+                LOGGER.info("GET %s -> %s", url, resp.status)
+                if resp.status == 304:
+                    raise NotModified(url)
+                if resp.status in RETRY_STATUSES:
+                    raise _RetryableError(f"Server error: {resp.status}")
+                if resp.status >= 500:
+                    raise APIClientError(f"Server error: {resp.status}")
+                if resp.status >= 400:
+                    raise APIClientError(f"Client error: {resp.status} - {await resp.text()}")
+                raw = await resp.read()
+                validators = validators_from_headers(resp.headers)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            raise _RetryableError(str(e) or type(e).__name__) from e
+        try:
+            data = orjson.loads(raw)
+        except ValueError as e:
+            raise APIClientError("Invalid JSON response") from e
+        if not isinstance(data, list):
+            raise APIClientError("Unexpected JSON shape - expected list")
+        return data, raw, validators
+
+    async def fetch(
+        self,
+        path: str,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+        with_raw: bool = False,
+    ) -> Union[List[Dict[str, Any]], Tuple[List[Dict[str, Any]], Optional[bytes]]]:
+        """Fetch one endpoint, retrying network and 5xx errors with full-jitter backoff.
+
+        Mirrors APIClient: validators make the request conditional (304 raises NotModified),
+        and ``with_raw`` returns ``(data, raw_bytes)``.
+        """
+        if self._session is None:
+            async with self:
+                return await self.fetch(path, etag=etag, last_modified=last_modified, with_raw=with_raw)
+        url = f"{self.base_url}/{path.lstrip('/')}"
+        headers = {}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+        for attempt in range(self.max_retries + 1):
+            LOGGER.debug("Requesting %s (attempt %d)", url, attempt + 1)
+            try:
+                data, raw, validators = await self._request_once(url, headers)
+                break
+            except _RetryableError as e:
+                if attempt == self.max_retries:
+                    LOGGER.critical("All retries failed for %s: %s", url, e)
+                    raise APIClientError(f"Failed to fetch {url}") from e
+                wait = full_jitter_backoff(attempt + 1, self.backoff_factor, self.backoff_cap)
+                LOGGER.warning("Transient error for %s: %s; retrying after %.2fs", url, e, wait)
+                await asyncio.sleep(wait)
+            except APIClientError as e:
+                LOGGER.error("API client error: %s", e)
+                raise
+        self.validators[path.strip("/")] = validators
+        LOGGER.debug("Received %d items from %s", len(data), url)
+        if with_raw:
+            return data, raw
+        return data
+
+    async def fetch_many(self, paths: Sequence[str]) -> List[List[Dict[str, Any]]]:
+        """Fetch several endpoints concurrently. Results are returned in the order of ``paths``."""
+        if self._session is None:
+            async with self:
+                return await self.fetch_many(paths)
+        return list(await asyncio.gather(*(self.fetch(p) for p in paths)))
@@ -1,17 +1,65 @@
 """Cache manager: in-memory + file-based JSON caching with TTL."""
 
-from typing import Any, Dict, Optional
-import json
+from typing import Any, Dict, List, Optional, Tuple
+import functools
+import gzip
+import heapq
 import os
 import time
 import logging
-from contextlib import contextmanager
+import threading
+from contextlib import contextmanager, suppress
 
+import orjson
+
+from .data_filter import (
+    FRAME_THRESHOLD,
+    POST_SEARCH_FIELDS,
+    USER_SEARCH_FIELDS,
+    attach_search_text,
+    strip_search_text,
+    build_post_frame,
+    build_post_index,
+    build_user_index,
+)
 from .utils import safe_get
 
 LOGGER = logging.getLogger(__name__)
 
 
+# payloads larger than this are gzip-compressed on disk
+GZIP_THRESHOLD = 64 * 1024
+
+# separates the envelope header from the data member in cache files
+_DATA_MARKER = b',"data":'
+
+# per-key lookup indexes, built once when data enters the memory cache
+_INDEXERS = {
+    "posts": build_post_index,
+    "users": build_user_index,
+}
+
+# columnar views for vectorized filtering of large datasets
+_FRAMERS = {
+    "posts": build_post_frame,
+}
+
+# fields packed into a lowercased "_search" string, once per item, for keyword filters
+_SEARCH_FIELDS = {
+    "posts": POST_SEARCH_FIELDS,
+    "users": USER_SEARCH_FIELDS,
+}
+
+
+def _validators(etag: Optional[str], last_modified: Optional[str]) -> Dict[str, str]:
+    validators = {}
+    if etag:
+        validators["etag"] = etag
+    if last_modified:
+        validators["last_modified"] = last_modified
+    return validators
+
+
 class CacheIOError(Exception):
     """Cache related IO errors."""
 
@@ -27,87 +75,348 @@ class CacheManager:
         self.cache_dir = cache_dir
         self.ttl = ttl_seconds
         os.makedirs(self.cache_dir, exist_ok=True)
-        # in-memory store: {key: (timestamp, data)}
+        # in-memory store: {key: {"ts", "mono_ts", "data", ...}}
         self._mem_cache: Dict[str, Dict[str, Any]] = {}
+        # guards _mem_cache when fetches run on worker threads
+        self._lock = threading.Lock()
+        # min-heap of (expiry, key) so purge_expired only touches entries that are due
+        self._heap: List[Tuple[float, str]] = []
+        # memoized (key, compressed) -> file path
+        self._path_cache: Dict[Tuple[str, bool], str] = {}
+        # memoized cache-file lookup; invalidated whenever this manager writes or removes files
+        self._locate = functools.lru_cache(maxsize=None)(self._find_file)
+        # lock-free read path: (key, ttl bucket) -> entry that stays fresh for the whole bucket
+        self._lookup = functools.lru_cache(maxsize=32)(self._fresh_for_bucket)
         LOGGER.debug("CacheManager initialized at %s with TTL=%s", cache_dir, ttl_seconds)
 
-    def _file_path(self, key: str) -> str:
-        safe_name = key.replace("/", "_").strip("_")
-        return os.path.join(self.cache_dir, f"{safe_name}.json")
+    def _file_path(self, key: str, compressed: bool = False) -> str:
+        path = self._path_cache.get((key, compressed))
+        if path is None:
+            safe_name = key.replace("/", "_").strip("_")
+            suffix = ".json.gz" if compressed else ".json"
+            path = os.path.join(self.cache_dir, f"{safe_name}{suffix}")
+            self._path_cache[(key, compressed)] = path
+        return path
 
-    def save(self, key: str, data: Any) -> None:
-        """Save data to file cache and memory."""
-        ts = int(time.time())
-        self._mem_cache[key] = {"ts": ts, "data": data}
-        path = self._file_path(key)
+    def _find_file(self, key: str) -> Optional[Tuple[str, bool]]:
+        """Return (path, compressed) of the cache file for key, or None if there is none."""
+        for compressed in (True, False):
+            path = self._file_path(key, compressed)
+            if os.path.exists(path):
+                return path, compressed
+        return None
+
+    def _mem_entry(
+        self,
+        key: str,
+        ts: int,
+        data: Any,
+        mono_ts: float,
+        validators: Dict[str, str],
+        raw: Optional[bytes] = None,
+    ) -> Dict[str, Any]:
+        # "ts" is wall-clock (persisted, human readable); "mono_ts" drives in-process TTL checks
+        entry = {"ts": ts, "mono_ts": mono_ts, "exp": mono_ts + self.ttl, **validators}
+        if raw is not None:
+            entry["raw"] = raw
+        if data is not None:
+            self._attach_data(key, entry, data)
+        return entry
+
+    @staticmethod
+    def _attach_data(key: str, entry: Dict[str, Any], data: Any) -> Any:
+        """Store parsed data on an entry along with its search text and lookup index."""
+        if isinstance(data, list):
+            fields = _SEARCH_FIELDS.get(key)
+            if fields is not None:
+                attach_search_text(data, fields)
+            indexer = _INDEXERS.get(key)
+            if indexer is not None:
+                entry["index"] = indexer(data)
+            framer = _FRAMERS.get(key)
+            if framer is not None and len(data) >= FRAME_THRESHOLD:
+                entry["frame"] = framer(data)
+        entry["data"] = data
+        return data
+
+    def _materialize(self, key: str, entry: Dict[str, Any]) -> Any:
+        """Return an entry's parsed data, decoding its raw bytes (or annotating parsed data) on first use."""
+        if "data" in entry:
+            return entry["data"]
+        if "parsed" in entry:
+            return self._attach_data(key, entry, entry.pop("parsed"))
         try:
-            with open(path, "w", encoding="utf-8") as fh:
-                json.dump({"ts": ts, "data": data}, fh, ensure_ascii=False, indent=2)
+            data = orjson.loads(entry["raw"])
+        except ValueError as e:
+            raise CacheIOError(f"Cached bytes for {key} are not valid JSON") from e
+        return self._attach_data(key, entry, data)
+
+    def _store(self, key: str, entry: Dict[str, Any]) -> None:
+        with self._lock:
+            self._mem_cache[key] = entry
+            heapq.heappush(self._heap, (entry["exp"], key))
+        self._lookup.cache_clear()
+
+    def _fresh_for_bucket(self, key: str, bucket: int) -> Optional[Dict[str, Any]]:
+        """Return the memory entry for key if it cannot expire before ``bucket`` ends, else None."""
+        with self._lock:
+            mem = self._mem_cache.get(key)
+        # exp >= bucket end means the TTL check would pass for every instant in this bucket
+        if mem is None or mem["exp"] < (bucket + 1) * self.ttl:
+            return None
+        return mem
+
+    @staticmethod
+    def _envelope(ts: int, validators: Dict[str, str], data_bytes: bytes) -> bytes:
+        """Build the file payload {"ts", [validators], "data"} around already-encoded data bytes.
+
+        "data" is always the last member so load_bytes can slice it out without parsing.
+        """
+        header = orjson.dumps({"ts": ts, **validators})
+        return header[:-1] + _DATA_MARKER + data_bytes + b"}"
+
+    def _write_payload(self, key: str, payload: bytes) -> None:
+        compressed = len(payload) > GZIP_THRESHOLD
+        if compressed:
+            payload = gzip.compress(payload, compresslevel=1)
+        path = self._file_path(key, compressed)
+        try:
+            fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                view = memoryview(payload)
+                while view:
+                    view = view[os.write(fd, view):]
+            finally:
+                os.close(fd)
+            # drop the other variant so load never picks up an outdated copy
+            with suppress(FileNotFoundError):
+                os.remove(self._file_path(key, not compressed))
             LOGGER.debug("Saved cache to %s", path)
         except OSError as e:
             LOGGER.exception("Failed to write cache file %s", path)
             raise CacheIOError(f"Failed to write cache file {path}") from e
+        finally:
+            self._locate.cache_clear()
+
+    def save(self, key: str, data: Any, etag: Optional[str] = None, last_modified: Optional[str] = None) -> None:
+        """Save data to file cache and memory, with optional HTTP validators for conditional GETs.
+
+        For "posts"/"users" the item dicts are annotated in place with a ``_search`` key
+        (kept out of the file), so ``data`` and later ``load()`` results carry it.
+        """
+        ts = int(time.time())
+        mono_ts = time.monotonic()
+        validators = _validators(etag, last_modified)
+        # serialize first: _mem_entry annotates items in place and the file stays raw
+        file_data = strip_search_text(data) if isinstance(data, list) else data
+        payload = self._envelope(ts, validators, orjson.dumps(file_data))
+        self._store(key, self._mem_entry(key, ts, data, mono_ts, validators))
+        self._write_payload(key, payload)
+
+    def save_bytes(
+        self,
+        key: str,
+        raw_bytes: bytes,
+        data: Any = None,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> None:
+        """Save a raw JSON response body without re-encoding it.
+
+        ``data`` may carry the already-parsed form; otherwise it is decoded lazily on first load.
+        """
+        ts = int(time.time())
+        validators = _validators(etag, last_modified)
+        self._store(key, self._mem_entry(key, ts, data, time.monotonic(), validators, raw=raw_bytes))
+        self._write_payload(key, self._envelope(ts, validators, raw_bytes))
+
+    def load_bytes(self, key: str, allow_stale: bool = False) -> Optional[bytes]:
+        """Return the raw JSON bytes of a cached entry without parsing its data, or None."""
+        with self._lock:
+            mem = self._mem_cache.get(key)
+        if mem is not None and "raw" in mem and (allow_stale or time.monotonic() - mem["mono_ts"] <= self.ttl):
+            return mem["raw"]
+        located = self._locate(key)
+        if located is None:
+            return None
+        path, compressed = located
+        try:
+            with open(path, "rb") as fh:
+                payload = fh.read()
+            if compressed:
+                payload = gzip.decompress(payload)
+            # validators are escaped JSON strings, so the first marker always precedes "data"
+            split = payload.index(_DATA_MARKER)
+            header = orjson.loads(payload[:split] + b"}")
+        except (OSError, ValueError) as e:
+            LOGGER.exception("Failed to read/parse cache file %s", path)
+            raise CacheIOError(f"Failed to read cache file {path}") from e
+        age = int(time.time()) - int(safe_get(header, "ts", 0))
+        if not allow_stale and age > self.ttl:
+            return None
+        return payload[split + len(_DATA_MARKER):-1]
+
+    def load(self, key: str, allow_stale: bool = False, prefer_file: bool = False) -> Optional[Any]:
+        """Load data from memory or file if TTL not expired. Returns None if no valid cache.
 
-    def load(self, key: str, allow_stale: bool = False) -> Optional[Any]:
-        """Load data from memory or file if TTL not expired. Returns None if no valid cache."""
+        An expired in-memory entry is authoritative (the file was written with the same
+        timestamp), so the file is only consulted in that case when ``prefer_file`` is set.
+        """
+        # fast path: memoized per TTL bucket, so repeat hits skip the lock and TTL arithmetic
+        if self.ttl > 0 and not allow_stale:
+            hit = self._lookup(key, int(time.monotonic() // self.ttl))
+            # a concurrent _store() can replace the entry after it was memoized; only trust
+            # the memo while it is still the live entry (dict.get is atomic, no lock needed)
+            if hit is not None and self._mem_cache.get(key) is hit:
+                return self._materialize(key, hit)
         # check memory first
-        mem = self._mem_cache.get(key)
-        now = int(time.time())
+        with self._lock:
+            mem = self._mem_cache.get(key)
         if mem:
-            age = now - mem["ts"]
+            age = time.monotonic() - mem["mono_ts"]
             if allow_stale or age <= self.ttl:
                 LOGGER.debug("Returning in-memory cache for %s (age=%ds)", key, age)
-                return mem["data"]
+                return self._materialize(key, mem)
             LOGGER.debug("In-memory cache expired for %s (age=%ds)", key, age)
+            if not prefer_file:
+                return None
         # then file
-        path = self._file_path(key)
-        if not os.path.exists(path):
-            LOGGER.debug("Cache file missing %s", path)
+        located = self._locate(key)
+        if located is None:
+            LOGGER.debug("Cache file missing for %s", key)
             return None
+        path, compressed = located
         try:
-            with open(path, "r", encoding="utf-8") as fh:
-                obj = json.load(fh)
+            with open(path, "rb") as fh:
+                payload = fh.read()
+            if compressed:
+                payload = gzip.decompress(payload)
+            obj = orjson.loads(payload)
             ts = safe_get(obj, "ts", 0)
             data = safe_get(obj, "data", None)
+            validators = _validators(safe_get(obj, "etag"), safe_get(obj, "last_modified"))
             if data is None:
                 LOGGER.warning("Cache file %s contained no data", path)
                 return None
-            age = now - int(ts)
+            # entries from another process only have a wall-clock timestamp
+            age = int(time.time()) - int(ts)
             if allow_stale or age <= self.ttl:
-                # refresh memory cache
-                self._mem_cache[key] = {"ts": int(ts), "data": data}
+                # refresh memory cache, rebasing the file's age onto the monotonic clock
+                self._store(key, self._mem_entry(key, int(ts), data, time.monotonic() - age, validators))
                 LOGGER.debug("Loaded cache from file %s (age=%ds)", path, age)
                 return data
+            # keep the stale entry so a follow-up revalidation does not re-read the file;
+            # search text and indexes are only built if it turns out to be reused
+            entry = self._mem_entry(key, int(ts), None, time.monotonic() - age, validators)
+            entry["parsed"] = data
+            self._store(key, entry)
             LOGGER.debug("Cache file expired %s (age=%ds)", path, age)
             return None
         except (OSError, ValueError) as e:
             LOGGER.exception("Failed to read/parse cache file %s", path)
             raise CacheIOError(f"Failed to read cache file {path}") from e
 
+    def get_validators(self, key: str) -> Dict[str, str]:
+        """Return {"etag", "last_modified"} stored with a (possibly stale) entry, for conditional GETs."""
+        with self._lock:
+            mem = self._mem_cache.get(key)
+        if mem is None:
+            if self.load(key, allow_stale=True, prefer_file=True) is None:
+                return {}
+            with self._lock:
+                mem = self._mem_cache.get(key) or {}
+        return _validators(mem.get("etag"), mem.get("last_modified"))
+
+    def touch(self, key: str) -> Optional[Any]:
+        """Restart the TTL of a (possibly stale) entry without changing its data. Returns the data or None."""
+        with self._lock:
+            mem = self._mem_cache.get(key)
+        if mem is None:
+            return None
+        data = self._materialize(key, mem)
+        if "raw" in mem:
+            self.save_bytes(key, mem["raw"], data=data, etag=mem.get("etag"), last_modified=mem.get("last_modified"))
+        else:
+            self.save(key, data, etag=mem.get("etag"), last_modified=mem.get("last_modified"))
+        LOGGER.debug("Revalidated cache for %s", key)
+        return data
+
+    def purge_expired(self, now: Optional[float] = None) -> int:
+        """Evict expired in-memory entries in O(k log n) for k expired. Returns the number evicted."""
+        if now is None:
+            now = time.monotonic()
+        evicted = 0
+        with self._lock:
+            while self._heap and self._heap[0][0] <= now:
+                exp, key = heapq.heappop(self._heap)
+                # skip heap records superseded by a later save of the same key
+                if self._mem_cache.get(key, {}).get("exp") == exp:
+                    del self._mem_cache[key]
+                    evicted += 1
+        if evicted:
+            self._lookup.cache_clear()
+            LOGGER.debug("Purged %d expired cache entries", evicted)
+        return evicted
+
+    def get_index(self, key: str) -> Optional[Any]:
+        """Return the lookup index built for an in-memory key, or None."""
+        with self._lock:
+            mem = self._mem_cache.get(key)
+        if not mem:
+            return None
+        self._materialize(key, mem)
+        return mem.get("index")
+
+    def get_frame(self, key: str) -> Optional[Any]:
+        """Return the DataFrame built for a large in-memory key, or None."""
+        with self._lock:
+            mem = self._mem_cache.get(key)
+        if not mem:
+            return None
+        self._materialize(key, mem)
+        return mem.get("frame")
+
     def clear(self, key: Optional[str] = None) -> None:
         """Clear a single key or all caches."""
         if key:
-            self._mem_cache.pop(key, None)
+            with self._lock:
+                self._mem_cache.pop(key, None)
+            self._lookup.cache_clear()
             try:
-                os.remove(self._file_path(key))
-            except Exception:
-                pass
+                for compressed in (False, True):
+                    with suppress(FileNotFoundError):
+                        os.unlink(self._file_path(key, compressed))
+            except OSError as e:
+                raise CacheIOError(f"Failed to remove cache file for {key}") from e
+            finally:
+                self._locate.cache_clear()
             LOGGER.info("Cleared cache for %s", key)
         else:
-            self._mem_cache.clear()
+            with self._lock:
+                self._mem_cache.clear()
+                self._heap.clear()
+            self._lookup.cache_clear()
             # remove files
-            for fname in os.listdir(self.cache_dir):
-                path = os.path.join(self.cache_dir, fname)
-                try:
-                    os.remove(path)
-                except Exception:
-                    pass
+            try:
+                with os.scandir(self.cache_dir) as it:
+                    for entry in it:
+                        if entry.is_file():
+                            with suppress(FileNotFoundError):
+                                os.unlink(entry.path)
+            except OSError as e:
+                raise CacheIOError(f"Failed to clear cache dir {self.cache_dir}") from e
+            finally:
+                self._locate.cache_clear()
             LOGGER.info("Cleared all cache files")
 
     def stats(self) -> Dict[str, Any]:
         """Return simple cache stats."""
+        with self._lock:
+            keys = list(self._mem_cache.keys())
+        with os.scandir(self.cache_dir) as it:
+            file_count = sum(1 for e in it if e.is_file() and e.name.endswith((".json", ".json.gz")))
         return {
-            "in_memory_keys": list(self._mem_cache.keys()),
-            "file_count": len([f for f in os.listdir(self.cache_dir) if f.endswith(".json")]),
+            "in_memory_keys": keys,
+            "file_count": file_count,
             "ttl_seconds": self.ttl,
         }
@@ -1,18 +1,23 @@
 """Command-line interface wiring for the application."""
 
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 import argparse
+import asyncio
 import logging
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 
-from .api_client import APIClient, APIClientError
+from .api_client import APIClient, APIClientError, NotModified
+from .async_api_client import AsyncAPIClient
 from .cache_manager import CacheManager, CacheIOError
 from .data_filter import (
     filter_posts,
     get_post_by_id,
     filter_users,
     get_user_by_id,
+    build_post_index,
+    build_user_index,
 )
 from .utils import colored, format_timing
 
@@ -22,9 +27,16 @@ LOGGER = logging.getLogger(__name__)
 class CLI:
     """CLI wrapper to parse args and call appropriate components."""
 
-    def __init__(self, api_client: APIClient, cache_manager: CacheManager) -> None:
+    def __init__(
+        self,
+        api_client: APIClient,
+        cache_manager: CacheManager,
+        async_client: Optional[AsyncAPIClient] = None,
+    ) -> None:
         self.api = api_client
         self.cache = cache_manager
+        # optional: batches multi-resource cache misses into one event loop
+        self.async_api = async_client
 
     def run(self, argv: Optional[List[str]] = None) -> int:
         parser = argparse.ArgumentParser(prog="api-integration", description="Global Trend - API Integration CLI")
@@ -81,42 +93,119 @@ class CLI:
             LOGGER.exception("Unhandled exception")
             print(colored("An unexpected error occurred. See logs for details.", "red"))
             return 3
+        finally:
+            # after the handler, so stale entries it revalidated are not dropped mid-flight
+            self.cache.purge_expired()
 
     def _fetch_with_cache(self, key: str, fetcher):
         """Helper to get data with cache and TTL. Returns (data, ms_elapsed, from_cache:bool)."""
-        start = time.time()
+        start = time.perf_counter()
         cached = self.cache.load(key)
         if cached is not None:
-            ms = time.time() - start
+            ms = time.perf_counter() - start
             return cached, ms, True
-        # fetch from API
-        data = fetcher()
-        self.cache.save(key, data)
-        ms = time.time() - start
+        # fetch from API, conditionally when a stale copy carries validators
+        validators = self.cache.get_validators(key)
+        try:
+            data, raw = fetcher(with_raw=True, **validators)
+        except NotModified:
+            data = self.cache.touch(key)
+            if data is not None:
+                ms = time.perf_counter() - start
+                return data, ms, True
+            # stale copy vanished between the checks - fetch it in full
+            data, raw = fetcher(with_raw=True)
+        self._save_fetched(key, data, raw, self.api.validators)
+        ms = time.perf_counter() - start
         return data, ms, False
 
+    def _save_fetched(self, key: str, data, raw: Optional[bytes], validators_by_key: Dict[str, Dict[str, str]]) -> None:
+        """Cache a fresh API response, reusing the received bytes when available."""
+        validators = validators_by_key.get(key, {})
+        if raw is not None:
+            self.cache.save_bytes(key, raw, data=data, **validators)
+        else:
+            self.cache.save(key, data, **validators)
+
+    async def _refresh_async(self, key: str):
+        """Async counterpart of the miss branch of _fetch_with_cache."""
+        path = f"/{key}"
+        validators = self.cache.get_validators(key)
+        try:
+            data, raw = await self.async_api.fetch(path, with_raw=True, **validators)
+        except NotModified:
+            data = self.cache.touch(key)
+            if data is not None:
+                return data
+            data, raw = await self.async_api.fetch(path, with_raw=True)
+        self._save_fetched(key, data, raw, self.async_api.validators)
+        return data
+
+    async def _fetch_many_with_cache(self, keys: List[str]) -> Dict[str, Any]:
+        """Load keys from cache and fetch all misses concurrently over a single session."""
+        results = {key: self.cache.load(key) for key in keys}
+        missing = [key for key, data in results.items() if data is None]
+        if missing:
+            async with self.async_api:
+                tasks = [asyncio.ensure_future(self._refresh_async(key)) for key in missing]
+                done, pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+                # one key failed: stop the others before the session they use is closed
+                for task in pending:
+                    task.cancel()
+                await asyncio.gather(*pending, return_exceptions=True)
+            for task in tasks:
+                if task in done and task.exception() is not None:
+                    raise task.exception()
+            results.update(zip(missing, (task.result() for task in tasks)))
+        return results
+
+    def _fetch_posts_and_users(self):
+        """Fetch posts and users concurrently so both cache misses overlap. Returns (posts, users)."""
+        if self.async_api is not None:
+            results = asyncio.run(self._fetch_many_with_cache(["posts", "users"]))
+            return results["posts"], results["users"]
+        with ThreadPoolExecutor(max_workers=2) as ex:
+            f_posts = ex.submit(self._fetch_with_cache, "posts", self.api.fetch_posts)
+            f_users = ex.submit(self._fetch_with_cache, "users", self.api.fetch_users)
+            posts, _, _ = f_posts.result()
+            users, _, _ = f_users.result()
+        return posts, users
+
+    def _indexes(self, posts, users):
+        """Return (posts_by_id, posts_by_user, users_by_id), reusing indexes kept by the cache."""
+        post_index = self.cache.get_index("posts") or build_post_index(posts)
+        user_index = self.cache.get_index("users") or build_user_index(users)
+        return post_index[0], post_index[1], user_index
+
     def _handle_list_posts(self, args, force: bool = False) -> int:
         """List posts with filters."""
         if force:
             self.cache.clear("posts")
         if force:
             # forced load from API (bypass file-based cache)
-            posts = self.api.fetch_posts()
-            self.cache.save("posts", posts)
+            posts, raw = self.api.fetch_posts(with_raw=True)
+            self._save_fetched("posts", posts, raw, self.api.validators)
             ms = 0.0
             from_cache = False
         else:
             posts, ms, from_cache = self._fetch_with_cache("posts", self.api.fetch_posts)
         # apply filters
-        filtered = filter_posts(posts, user_id=getattr(args, "user_id", None), limit=getattr(args, "limit", None), search=getattr(args, "search", None))
+        filtered = filter_posts(
+            posts,
+            user_id=getattr(args, "user_id", None),
+            limit=getattr(args, "limit", None),
+            search=getattr(args, "search", None),
+            frame=self.cache.get_frame("posts"),
+        )
         # print header
         source = "cache" if from_cache else "api"
         print(colored(f"Showing {len(filtered)} posts (source: {source}, time: {format_timing(ms)})", "cyan"))
-        for p in filtered:
-            title = p.get("title", "<no title>")
-            pid = p.get("id", "<no id>")
-            uid = p.get("userId", "<no userId>")
-            print(f"[{pid}] (user {uid}) {title}")
+        # one write instead of a print (lock + flush) per row
+        lines = [
+            f"[{p.get('id', '<no id>')}] (user {p.get('userId', '<no userId>')}) {p.get('title', '<no title>')}\n"
+            for p in filtered
+        ]
+        sys.stdout.write("".join(lines))
         return 0
 
     def _handle_list_users(self, args, force: bool = False) -> int:
@@ -127,33 +216,30 @@ class CLI:
         filtered = filter_users(users, limit=getattr(args, "limit", None), search=getattr(args, "search", None))
         source = "cache" if from_cache else "api"
         print(colored(f"Showing {len(filtered)} users (source: {source}, time: {format_timing(ms)})", "cyan"))
-        for u in filtered:
-            uid = u.get("id", "<no id>")
-            name = u.get("name", "<no name>")
-            username = u.get("username", "")
-            print(f"[{uid}] {name} (@{username})")
+        lines = [f"[{u.get('id', '<no id>')}] {u.get('name', '<no name>')} (@{u.get('username', '')})\n" for u in filtered]
+        sys.stdout.write("".join(lines))
         return 0
 
     def _handle_get_post(self, post_id: int, force: bool = False) -> int:
         """Get single post and show associated user info."""
         if force:
             self.cache.clear("posts")
-        posts, ms_posts, from_cache_posts = self._fetch_with_cache("posts", self.api.fetch_posts)
-        post = get_post_by_id(posts, post_id)
+        posts, users = self._fetch_posts_and_users()
+        posts_by_id, posts_by_user, users_by_id = self._indexes(posts, users)
+        post = get_post_by_id(posts, post_id, index=posts_by_id)
         if not post:
             print(colored(f"Post with id {post_id} not found.", "yellow"))
             return 1
         # get user for this post
         user_id = post.get("userId")
-        users, ms_users, from_cache_users = self._fetch_with_cache("users", self.api.fetch_users)
-        user = get_user_by_id(users, user_id)
+        user = get_user_by_id(users, user_id, index=users_by_id)
         print(colored(f"Post [{post_id}] - {post.get('title')}", "green"))
         print(post.get("body", ""))
         if user:
             print(colored(f"\nAuthor: {user.get('name')} (@{user.get('username')})", "blue"))
             print(f"Email: {user.get('email')}")
             # posts count
-            count = len([p for p in posts if p.get("userId") == user.get("id")])
+            count = len(posts_by_user.get(user.get("id"), ()))
             print(colored(f"Author posts: {count}", "magenta"))
         else:
             print(colored("Author info not available.", "yellow"))
@@ -164,13 +250,13 @@ class CLI:
         if force:
             self.cache.clear("users")
             self.cache.clear("posts")
-        users, ms_users, from_cache_users = self._fetch_with_cache("users", self.api.fetch_users)
-        user = get_user_by_id(users, user_id)
+        posts, users = self._fetch_posts_and_users()
+        _, posts_by_user, users_by_id = self._indexes(posts, users)
+        user = get_user_by_id(users, user_id, index=users_by_id)
         if not user:
             print(colored(f"User with id {user_id} not found.", "yellow"))
             return 1
-        posts, ms_posts, from_cache_posts = self._fetch_with_cache("posts", self.api.fetch_posts)
-        post_count = len([p for p in posts if p.get("userId") == user_id])
+        post_count = len(posts_by_user.get(user_id, ()))
         print(colored(f"User [{user_id}] {user.get('name')} (@{user.get('username')})", "green"))
         print(f"Email: {user.get('email')}")
         print(f"Company: {user.get('company', {}).get('name')}")
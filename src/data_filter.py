@@ -1,33 +1,131 @@
 """Filtering utilities for posts and users."""
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple, TYPE_CHECKING
 import logging
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 LOGGER = logging.getLogger(__name__)
 
+# below this many rows plain list comprehensions beat building a DataFrame
+FRAME_THRESHOLD = 10_000
+
+POST_SEARCH_FIELDS = ("title", "body")
+USER_SEARCH_FIELDS = ("name", "username")
+
+
+def _joined_text(item: Dict[str, Any], fields: Tuple[str, ...]) -> str:
+    # API data may carry null or non-string values; treat them as text instead of failing
+    return "\n".join(str(item.get(f) or "") for f in fields).lower()
+
+
+def attach_search_text(items: List[Dict[str, Any]], fields: Tuple[str, ...]) -> List[Dict[str, Any]]:
+    """Store a pre-lowercased ``_search`` string on each item so searches skip per-call lowercasing.
+
+    Items are modified in place; use strip_search_text to get plain copies.
+    """
+    for item in items:
+        item["_search"] = _joined_text(item, fields)
+    return items
+
+
+def strip_search_text(items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Return items without the ``_search`` annotation (copies only when annotated)."""
+    if not items or not isinstance(items[0], dict) or "_search" not in items[0]:
+        return items
+    return [{k: v for k, v in item.items() if k != "_search"} for item in items]
+
+
+def _search_text(item: Dict[str, Any], fields: Tuple[str, ...]) -> str:
+    text = item.get("_search")
+    if text is None:
+        text = _joined_text(item, fields)
+    return text
+
+
+def build_post_frame(posts: List[Dict[str, Any]]) -> Optional["pd.DataFrame"]:
+    """Build a columnar view of posts for vectorized filtering; None when pandas is unavailable."""
+    # imported lazily: pandas costs hundreds of ms at startup and is only used for 10k+ rows
+    try:
+        import pandas as pd
+    except ImportError:
+        return None
+    texts = [_search_text(p, POST_SEARCH_FIELDS) for p in posts]
+    return pd.DataFrame({"userId": [p.get("userId") for p in posts], "_search": texts})
+
+
+def _filter_posts_frame(
+    posts: List[Dict[str, Any]],
+    frame: "pd.DataFrame",
+    user_id: Optional[int],
+    limit: Optional[int],
+    search: Optional[str],
+) -> List[Dict[str, Any]]:
+    mask = None
+    if user_id is not None:
+        mask = frame["userId"] == user_id
+    if search:
+        matches = frame["_search"].str.contains(search.lower(), regex=False)
+        mask = matches if mask is None else mask & matches
+    # the frame's RangeIndex lines up with list positions, so map back to the original dicts
+    positions = frame.index if mask is None else frame.index[mask]
+    if limit is not None:
+        positions = positions[:limit]
+    results = [posts[i] for i in positions]
+    LOGGER.debug("Filtered %d posts via DataFrame -> %d results", len(frame), len(results))
+    return results
+
 
 def filter_posts(
     posts: List[Dict[str, Any]],
     user_id: Optional[int] = None,
     limit: Optional[int] = None,
     search: Optional[str] = None,
+    frame: Optional["pd.DataFrame"] = None,
 ) -> List[Dict[str, Any]]:
-    """Filter posts by user_id, search keyword in title/body, and limit results."""
+    """Filter posts by user_id, search keyword in title/body, and limit results.
+
+    ``frame`` (from build_post_frame over the same list) switches to vectorized filtering.
+    """
+    if frame is not None and len(frame) == len(posts):
+        return _filter_posts_frame(posts, frame, user_id, limit, search)
     results = posts
     if user_id is not None:
         results = [p for p in results if p.get("userId") == user_id]
         LOGGER.debug("Filtered posts by user_id=%s -> %d results", user_id, len(results))
     if search:
         s = search.lower()
-        results = [p for p in results if s in (p.get("title", "").lower() + p.get("body", "").lower())]
+        results = [p for p in results if s in _search_text(p, POST_SEARCH_FIELDS)]
         LOGGER.debug("Filtered posts by search='%s' -> %d results", search, len(results))
     if limit is not None:
         results = results[:limit]
     return results
 
 
-def get_post_by_id(posts: List[Dict[str, Any]], post_id: int) -> Optional[Dict[str, Any]]:
-    """Return a post matching id or None."""
+def build_post_index(posts: List[Dict[str, Any]]) -> Tuple[Dict[int, Dict[str, Any]], Dict[int, List[Dict[str, Any]]]]:
+    """Build (by_id, by_user) lookup tables for posts in a single pass."""
+    by_id: Dict[int, Dict[str, Any]] = {}
+    by_user: Dict[int, List[Dict[str, Any]]] = {}
+    for p in posts:
+        by_id[p.get("id")] = p
+        by_user.setdefault(p.get("userId"), []).append(p)
+    return by_id, by_user
+
+
+def build_user_index(users: List[Dict[str, Any]]) -> Dict[int, Dict[str, Any]]:
+    """Build an id -> user lookup table."""
+    return {u.get("id"): u for u in users}
+
+
+def get_post_by_id(
+    posts: List[Dict[str, Any]],
+    post_id: int,
+    index: Optional[Dict[int, Dict[str, Any]]] = None,
+) -> Optional[Dict[str, Any]]:
+    """Return a post matching id or None. Uses ``index`` (from build_post_index) when given."""
+    if index is not None:
+        return index.get(post_id)
     for p in posts:
         if p.get("id") == post_id:
             return p
@@ -39,15 +137,21 @@ def filter_users(users: List[Dict[str, Any]], limit: Optional[int] = None, searc
     results = users
     if search:
         s = search.lower()
-        results = [u for u in results if s in (u.get("name", "").lower() + u.get("username", "").lower())]
+        results = [u for u in results if s in _search_text(u, USER_SEARCH_FIELDS)]
     if limit is not None:
         results = results[:limit]
     LOGGER.debug("filter_users -> %d results", len(results))
     return results
 
 
-def get_user_by_id(users: List[Dict[str, Any]], user_id: int) -> Optional[Dict[str, Any]]:
-    """Return a user by id or None."""
+def get_user_by_id(
+    users: List[Dict[str, Any]],
+    user_id: int,
+    index: Optional[Dict[int, Dict[str, Any]]] = None,
+) -> Optional[Dict[str, Any]]:
+    """Return a user by id or None. Uses ``index`` (from build_user_index) when given."""
+    if index is not None:
+        return index.get(user_id)
     for u in users:
         if u.get("id") == user_id:
             return u
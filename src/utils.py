@@ -1,6 +1,7 @@
 """Utility helpers: timing context manager, validation and colored printing helpers."""
 
 from contextlib import contextmanager
+import sys
 import time
 import logging
 from typing import Iterator, Tuple, Any, Dict
@@ -11,6 +12,20 @@ colorama_init(autoreset=True)
 
 LOGGER = logging.getLogger(__name__)
 
+_COLORS = {
+    "green": Fore.GREEN,
+    "red": Fore.RED,
+    "yellow": Fore.YELLOW,
+    "blue": Fore.BLUE,
+    "magenta": Fore.MAGENTA,
+    "cyan": Fore.CYAN,
+    "white": Fore.WHITE,
+}
+# pre-built "<prefix>{}<reset>" templates, one per color
+_TEMPLATES = {name: prefix + "{}" + Style.RESET_ALL for name, prefix in _COLORS.items()}
+# skip escape codes entirely when output is piped or redirected
+_COLOR_ENABLED = bool(getattr(sys.stdout, "isatty", lambda: False)())
+
 
 @contextmanager
 def timer(name: str) -> Iterator[float]:
@@ -20,11 +35,15 @@ def timer(name: str) -> Iterator[float]:
         with timer("fetch"):
             ...
     """
-    start = time.time()
+    if not LOGGER.isEnabledFor(logging.DEBUG):
+        # nothing would be logged - skip the clock reads
+        yield 0.0
+        return
+    start = time.perf_counter()
     try:
         yield start
     finally:
-        elapsed = time.time() - start
+        elapsed = time.perf_counter() - start
         LOGGER.debug("%s finished in %.3fs", name, elapsed)
 
 
@@ -37,16 +56,10 @@ def safe_get(data: Dict[str, Any], key: str, default: Any = None) -> Any:
 
 
 def colored(text: str, color: str = "green") -> str:
-    """Return colored text for terminals."""
-    colors = {
-        "green": Fore.GREEN,
-        "red": Fore.RED,
-        "yellow": Fore.YELLOW,
-        "blue": Fore.BLUE,
-        "magenta": Fore.MAGENTA,
-        "cyan": Fore.CYAN,
-    }
-    return f"{colors.get(color, Fore.WHITE)}{text}{Style.RESET_ALL}"
+    """Return colored text for terminals; plain text when stdout is not a TTY."""
+    if not _COLOR_ENABLED:
+        return text
+    return _TEMPLATES.get(color, _TEMPLATES["white"]).format(text)
 
 
 def format_timing(ms: float) -> str:
@@ -1,20 +1,37 @@
 
+import io
 import unittest
-from unittest.mock import patch, Mock
-from src.api_client import APIClient, APIClientError
+from unittest.mock import patch, Mock, PropertyMock
+import requests
+from urllib3.util.retry import RequestHistory
+from src.api_client import APIClient, APIClientError, FullJitterRetry, NotModified
 
 class TestAPIClient(unittest.TestCase):
 
+    @classmethod
+    def setUpClass(cls):
+        # one client (and session) shared by all tests; Session.get is patched per test
+        cls.client = APIClient(base_url="https://jsonplaceholder.typicode.com", timeout=1, max_retries=1)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.client.session.close()
+
+    def setUp(self):
+        # validators recorded by an earlier test must not leak into the next one
+        self.client.validators.clear()
+
     @patch("src.api_client.requests.Session.get")
     def test_case_1_fetch_posts_success(self, mock_get):
         """Test Case 1: Successful fetch of posts"""
 
         mock_resp = Mock()
         mock_resp.status_code = 200
-        mock_resp.json.return_value = [{"id": 1, "title": "ok"}]
+        mock_resp.headers = {"Content-Length": "64"}
+        mock_resp.content = b'[{"id": 1, "title": "ok"}]'
         mock_get.return_value = mock_resp
 
-        client = APIClient(base_url="https://jsonplaceholder.typicode.com", timeout=1, max_retries=1)
+        client = self.client
 
         posts = client.fetch_posts()
 
@@ -28,10 +45,11 @@ class TestAPIClient(unittest.TestCase):
 
         mock_resp = Mock()
         mock_resp.status_code = 200
-        mock_resp.json.side_effect = ValueError("Invalid JSON")
+        mock_resp.headers = {"Content-Length": "64"}
+        mock_resp.content = b"<html>not json</html>"
         mock_get.return_value = mock_resp
 
-        client = APIClient(base_url="https://jsonplaceholder.typicode.com", timeout=1, max_retries=1)
+        client = self.client
 
         try:
             client.fetch_posts()
@@ -41,5 +59,121 @@ class TestAPIClient(unittest.TestCase):
 
         self.fail("APIClientError was not raised")
 
+    def test_case_7_pooled_adapter_mounted(self):
+        """Test Case 7: Session uses a pooled adapter with connection-level retries"""
+
+        client = APIClient(base_url="https://jsonplaceholder.typicode.com", timeout=1, max_retries=2)
+
+        adapter = client.session.get_adapter("https://jsonplaceholder.typicode.com/posts")
+
+        print("Test Case 7 Passed: Pooled adapter with retries mounted")
+
+        self.assertEqual(adapter.max_retries.total, 2)
+        self.assertIn(503, adapter.max_retries.status_forcelist)
+
+    def test_case_8_full_jitter_backoff_capped(self):
+        """Test Case 8: Backoff is randomized and never exceeds the cap"""
+
+        failure = RequestHistory("GET", "/posts", None, 503, None)
+        retry = FullJitterRetry(total=10, backoff_factor=1.0, backoff_cap=2.0).new(history=(failure,) * 6)
+
+        with patch("src.api_client.random.uniform", side_effect=lambda lo, hi: hi) as mock_uniform:
+            wait = retry.get_backoff_time()
+
+        print("Test Case 8 Passed: Full jitter backoff respects the cap")
+
+        mock_uniform.assert_called_once_with(0, 2.0)
+        self.assertEqual(wait, 2.0)
+
+    def test_case_22_first_retry_is_jittered(self):
+        """Test Case 22: The first retry waits uniform(0, backoff_factor), not zero"""
+
+        failure = RequestHistory("GET", "/posts", None, 503, None)
+        retry = FullJitterRetry(total=10, backoff_factor=0.5, backoff_cap=30.0).new(history=(failure,))
+
+        with patch("src.api_client.random.uniform", side_effect=lambda lo, hi: hi) as mock_uniform:
+            wait = retry.get_backoff_time()
+
+        print("Test Case 22 Passed: First retry is jittered")
+
+        mock_uniform.assert_called_once_with(0, 0.5)
+        self.assertEqual(wait, 0.5)
+        self.assertEqual(FullJitterRetry(total=10, backoff_factor=0.5).get_backoff_time(), 0)
+
+    @patch("src.api_client.requests.Session.get")
+    def test_case_13_large_body_streamed(self, mock_get):
+        """Test Case 13: Bodies without a small Content-Length are parsed incrementally"""
+
+        mock_resp = Mock()
+        mock_resp.status_code = 200
+        mock_resp.headers = {}
+        mock_resp.raw = io.BytesIO(b'[{"id": 1, "title": "ok"}, {"id": 2, "title": "ok"}]')
+        mock_get.return_value = mock_resp
+
+        client = self.client
+
+        posts = client.fetch_posts()
+
+        print("Test Case 13 Passed: Streamed response parsed into a list")
+
+        mock_resp.json.assert_not_called()
+        self.assertEqual([p["id"] for p in posts], [1, 2])
+
+    @patch("src.api_client.requests.Session.get")
+    def test_case_17_conditional_get_not_modified(self, mock_get):
+        """Test Case 17: Validators are sent and a 304 raises NotModified"""
+
+        mock_resp = Mock()
+        mock_resp.status_code = 304
+        mock_resp.headers = {}
+        mock_get.return_value = mock_resp
+
+        client = self.client
+
+        with self.assertRaises(NotModified):
+            client.fetch_posts(etag='W/"abc"', last_modified="Wed, 01 Jan 2025 00:00:00 GMT")
+
+        print("Test Case 17 Passed: Conditional GET raised NotModified")
+
+        headers = mock_get.call_args.kwargs["headers"]
+        self.assertEqual(headers["If-None-Match"], 'W/"abc"')
+        self.assertEqual(headers["If-Modified-Since"], "Wed, 01 Jan 2025 00:00:00 GMT")
+
+    @patch("src.api_client.requests.Session.get")
+    def test_case_34_truncated_body_raises_client_error(self, mock_get):
+        """Test Case 34: A body cut short mid-read surfaces as APIClientError"""
+
+        mock_resp = Mock()
+        mock_resp.status_code = 200
+        mock_resp.headers = {"Content-Length": "100"}
+        type(mock_resp).content = PropertyMock(side_effect=requests.exceptions.ChunkedEncodingError("truncated"))
+        mock_get.return_value = mock_resp
+
+        client = self.client
+
+        with self.assertRaises(APIClientError):
+            client.fetch_posts()
+
+        print("Test Case 34 Passed: Truncated body raised APIClientError")
+
+    @patch("src.api_client.requests.Session.get")
+    def test_case_35_encoded_body_streamed(self, mock_get):
+        """Test Case 35: Content-Length of a gzip body is not its decoded size, so it is streamed"""
+
+        mock_resp = Mock()
+        mock_resp.status_code = 200
+        mock_resp.headers = {"Content-Length": "64", "Content-Encoding": "gzip"}
+        mock_resp.raw = io.BytesIO(b'[{"id": 1, "title": "ok"}]')
+        mock_get.return_value = mock_resp
+
+        client = self.client
+
+        posts, raw = client.fetch_posts(with_raw=True)
+
+        print("Test Case 35 Passed: Encoded response streamed instead of buffered")
+
+        self.assertIsNone(raw)
+        self.assertEqual(posts[0]["id"], 1)
+
 if __name__ == "__main__":
     unittest.main()
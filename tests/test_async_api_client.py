@@ -0,0 +1,115 @@
+import asyncio
+import unittest
+from unittest.mock import patch, AsyncMock
+import aiohttp
+from src.api_client import APIClientError, NotModified
+from src.async_api_client import AsyncAPIClient
+
+
+class FakeResponse:
+
+    def __init__(self, status, body=b"[]", headers=None):
+        self.status = status
+        self.body = body
+        self.headers = headers or {}
+
+    async def read(self):
+        return self.body
+
+    async def text(self):
+        return self.body.decode()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+
+class FakeSession:
+
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.calls = []
+
+    def get(self, url, headers=None):
+        self.calls.append((url, headers))
+        resp = self.responses.pop(0)
+        if isinstance(resp, Exception):
+            raise resp
+        return resp
+
+    async def close(self):
+        pass
+
+
+class TestAsyncAPIClient(unittest.IsolatedAsyncioTestCase):
+
+    def make_client(self, responses):
+        client = AsyncAPIClient(base_url="https://jsonplaceholder.typicode.com", timeout=1, max_retries=2)
+        client._session = FakeSession(responses)
+        return client
+
+    async def test_case_24_fetch_many_keeps_order(self):
+        """Test Case 24: fetch_many returns results in request order, not completion order"""
+
+        client = self.make_client([])
+
+        async def fake_fetch(path):
+            await asyncio.sleep(0.02 if path == "/posts" else 0)
+            return [{"path": path}]
+
+        with patch.object(client, "fetch", side_effect=fake_fetch):
+            results = await client.fetch_many(["/posts", "/users"])
+
+        print("Test Case 24 Passed: fetch_many preserved order")
+
+        self.assertEqual(results, [[{"path": "/posts"}], [{"path": "/users"}]])
+
+    @patch("src.async_api_client.asyncio.sleep", new_callable=AsyncMock)
+    async def test_case_25_retries_transient_errors(self, mock_sleep):
+        """Test Case 25: 503s and connection errors are retried with backoff"""
+
+        client = self.make_client([
+            FakeResponse(503),
+            aiohttp.ClientConnectionError("reset"),
+            FakeResponse(200, b'[{"id": 1}]', {"ETag": '"v1"'}),
+        ])
+
+        data, raw = await client.fetch("/posts", with_raw=True)
+
+        print("Test Case 25 Passed: transient errors retried")
+
+        self.assertEqual(data, [{"id": 1}])
+        self.assertEqual(raw, b'[{"id": 1}]')
+        self.assertEqual(len(client._session.calls), 3)
+        self.assertEqual(mock_sleep.await_count, 2)
+        self.assertEqual(client.validators["posts"], {"etag": '"v1"'})
+
+    @patch("src.async_api_client.asyncio.sleep", new_callable=AsyncMock)
+    async def test_case_26_error_mapping(self, mock_sleep):
+        """Test Case 26: Errors map to APIClientError / NotModified like APIClient"""
+
+        client = self.make_client([FakeResponse(404, b"missing")])
+        with self.assertRaises(APIClientError):
+            await client.fetch("/posts")
+        self.assertEqual(len(client._session.calls), 1)
+
+        client = self.make_client([FakeResponse(503)] * 3)
+        with self.assertRaises(APIClientError):
+            await client.fetch("/posts")
+        self.assertEqual(len(client._session.calls), 3)
+
+        client = self.make_client([FakeResponse(200, b"<html>")])
+        with self.assertRaises(APIClientError):
+            await client.fetch("/posts")
+
+        client = self.make_client([FakeResponse(304)])
+        with self.assertRaises(NotModified):
+            await client.fetch("/posts", etag='"v1"')
+        self.assertEqual(client._session.calls[0][1], {"If-None-Match": '"v1"'})
+
+        print("Test Case 26 Passed: errors mapped correctly")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,150 @@
+import os
+import tempfile
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+import orjson
+from src.cache_manager import CacheManager, GZIP_THRESHOLD
+
+POSTS = [
+    {"id": 1, "userId": 1, "title": "Hello World", "body": "First post"},
+    {"id": 2, "userId": 2, "title": "Another", "body": "Second post about Python"},
+]
+
+class TestCacheManager(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cache = CacheManager(cache_dir=self.tmp.name, ttl_seconds=60)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_case_10_file_roundtrip(self):
+        self.cache.save("posts", POSTS)
+        fresh = CacheManager(cache_dir=self.tmp.name, ttl_seconds=60)
+        print("Test Case 10 Passed: cache file roundtrip restored data")
+        self.assertEqual(fresh.load("posts"), POSTS)
+
+    def test_case_11_large_payload_gzipped(self):
+        big = [{"id": i, "userId": 1, "title": "t" * 100, "body": "b" * 500} for i in range(GZIP_THRESHOLD // 500)]
+        self.cache.save("posts", big)
+        fresh = CacheManager(cache_dir=self.tmp.name, ttl_seconds=60)
+        print("Test Case 11 Passed: large payloads are stored gzip-compressed")
+        self.assertTrue(os.path.exists(os.path.join(self.tmp.name, "posts.json.gz")))
+        self.assertFalse(os.path.exists(os.path.join(self.tmp.name, "posts.json")))
+        self.assertEqual(fresh.load("posts"), big)
+
+    def test_case_14_memory_ttl_uses_monotonic_clock(self):
+        self.cache.save("posts", POSTS)
+        later = time.monotonic() + 61
+        with patch("src.cache_manager.time.monotonic", return_value=later):
+            expired = self.cache.load("posts")
+            stale = self.cache.load("posts", allow_stale=True)
+        print("Test Case 14 Passed: in-memory TTL follows the monotonic clock")
+        self.assertIsNone(expired)
+        self.assertEqual(stale, POSTS)
+
+    def test_case_15_clear_and_stats(self):
+        self.cache.save("posts", POSTS)
+        self.cache.save("users", [])
+        before = self.cache.stats()["file_count"]
+        self.cache.clear()
+        print("Test Case 15 Passed: clear() removed all cache files")
+        self.assertEqual(before, 2)
+        self.assertEqual(self.cache.stats(), {"in_memory_keys": [], "file_count": 0, "ttl_seconds": 60})
+
+    def test_case_16_purge_expired(self):
+        self.cache.save("posts", POSTS)
+        self.cache.save("users", [])
+        self.cache.save("posts", POSTS)
+        evicted = self.cache.purge_expired(now=time.monotonic() + 61)
+        print("Test Case 16 Passed: purge_expired evicted each expired key once")
+        self.assertEqual(evicted, 2)
+        self.assertEqual(self.cache.stats()["in_memory_keys"], [])
+        self.assertEqual(self.cache.purge_expired(), 0)
+
+    def test_case_18_validators_and_touch(self):
+        self.cache.save("posts", POSTS, etag='W/"abc"')
+        fresh = CacheManager(cache_dir=self.tmp.name, ttl_seconds=60)
+        validators = fresh.get_validators("posts")
+        later = time.monotonic() + 61
+        with patch("src.cache_manager.time.monotonic", return_value=later):
+            self.assertIsNone(fresh.load("posts"))
+            touched = fresh.touch("posts")
+            reloaded = fresh.load("posts")
+        print("Test Case 18 Passed: validators persisted and touch() restarted the TTL")
+        self.assertEqual(validators, {"etag": 'W/"abc"'})
+        self.assertEqual(touched, POSTS)
+        self.assertEqual(reloaded, POSTS)
+        with open(os.path.join(self.tmp.name, "posts.json"), "rb") as fh:
+            self.assertNotIn(b"_search", fh.read())
+
+    def test_case_19_raw_bytes_roundtrip(self):
+        raw = b'[{"id": 1, "userId": 1, "title": "Hello World", "body": "First post"}]'
+        self.cache.save_bytes("posts", raw, etag='"v1"')
+        fresh = CacheManager(cache_dir=self.tmp.name, ttl_seconds=60)
+        print("Test Case 19 Passed: raw response bytes cached and parsed lazily")
+        self.assertEqual(self.cache.load_bytes("posts"), raw)
+        self.assertEqual(fresh.load_bytes("posts"), raw)
+        self.assertEqual(self.cache.load("posts")[0]["title"], "Hello World")
+        self.assertEqual(fresh.load("posts")[0]["id"], 1)
+        self.assertEqual(fresh.get_validators("posts"), {"etag": '"v1"'})
+
+    def test_case_21_bucketed_lookup_invalidated_on_save(self):
+        with patch("src.cache_manager.time.monotonic", return_value=120.0):
+            self.cache.save("posts", POSTS)
+            first = self.cache.load("posts")
+            self.cache.save("posts", POSTS[:1])
+            second = self.cache.load("posts")
+        with patch("src.cache_manager.time.monotonic", return_value=185.0):
+            expired = self.cache.load("posts")
+        print("Test Case 21 Passed: bucketed lookup served fresh data and honoured the TTL")
+        self.assertEqual(first, POSTS)
+        self.assertEqual(second, POSTS[:1])
+        self.assertIsNone(expired)
+
+    def test_case_23_stale_file_read_once_for_revalidation(self):
+        self.cache.save("posts", POSTS, etag='"v1"')
+        fresh = CacheManager(cache_dir=self.tmp.name, ttl_seconds=60)
+        with patch("src.cache_manager.time.time", return_value=time.time() + 61):
+            with patch("src.cache_manager.orjson.loads", wraps=orjson.loads) as mock_loads:
+                missed = fresh.load("posts")
+                validators = fresh.get_validators("posts")
+                touched = fresh.touch("posts")
+        print("Test Case 23 Passed: expired file parsed once for load + revalidation")
+        self.assertIsNone(missed)
+        self.assertEqual(validators, {"etag": '"v1"'})
+        self.assertEqual(touched, POSTS)
+        self.assertEqual(mock_loads.call_count, 1)
+
+    def test_case_29_concurrent_save_and_load(self):
+        def worker(n):
+            key = f"k{n % 4}"
+            for _ in range(50):
+                self.cache.save(key, [{"id": n}])
+                self.assertIsNotNone(self.cache.load(key))
+        with ThreadPoolExecutor(max_workers=8) as ex:
+            list(ex.map(worker, range(8)))
+        print("Test Case 29 Passed: concurrent save/load kept the cache consistent")
+        self.assertEqual(sorted(self.cache.stats()["in_memory_keys"]), ["k0", "k1", "k2", "k3"])
+
+    def test_case_30_null_fields_cached_and_searchable(self):
+        posts = [{"id": 1, "userId": 1, "title": None, "body": 42}]
+        self.cache.save("posts", posts)
+        print("Test Case 30 Passed: null and non-string fields are cached without errors")
+        self.assertEqual(self.cache.load("posts")[0]["_search"], "\n42")
+
+    def test_case_31_memoized_hit_ignored_once_replaced(self):
+        self.cache.save("posts", POSTS)
+        self.assertEqual(self.cache.load("posts"), POSTS)
+        # emulate a save racing the memoization: replace the entry without clearing the memo
+        replacement = self.cache._mem_entry("posts", int(time.time()), POSTS[:1], time.monotonic(), {})
+        with self.cache._lock:
+            self.cache._mem_cache["posts"] = replacement
+        print("Test Case 31 Passed: stale memoized entry is not served after replacement")
+        self.assertEqual(self.cache.load("posts"), POSTS[:1])
+
+if __name__ == "__main__":
+    unittest.main()
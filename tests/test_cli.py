@@ -0,0 +1,129 @@
+import asyncio
+import io
+import tempfile
+import time
+import unittest
+from contextlib import redirect_stdout
+from unittest.mock import patch, Mock, AsyncMock
+import orjson
+from src.api_client import APIClientError, NotModified
+from src.async_api_client import AsyncAPIClient
+from src.cache_manager import CacheManager
+from src.cli import CLI
+
+POSTS = [
+    {"id": 1, "userId": 1, "title": "Hello World", "body": "First post"},
+    {"id": 2, "userId": 2, "title": "Another", "body": "Second post about Python"},
+    {"id": 3, "userId": 1, "title": "Search Me", "body": "Contains keyword"},
+]
+
+USERS = [
+    {"id": 1, "name": "Alice", "username": "alice", "email": "a@example.com"},
+    {"id": 2, "name": "Bob", "username": "bobby", "email": "b@example.com"},
+]
+
+
+class TestCLI(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cache = CacheManager(cache_dir=self.tmp.name, ttl_seconds=60)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def run_cli(self, cli, argv):
+        out = io.StringIO()
+        with redirect_stdout(out):
+            code = cli.run(argv)
+        return code, out.getvalue()
+
+    def test_case_27_threaded_fetch_for_get_user(self):
+        api = Mock()
+        # copies: saving annotates the item dicts in place with "_search"
+        posts, users = [dict(p) for p in POSTS], [dict(u) for u in USERS]
+        api.fetch_posts.return_value = (posts, orjson.dumps(posts))
+        api.fetch_users.return_value = (users, orjson.dumps(users))
+        api.validators = {"posts": {"etag": '"p1"'}, "users": {}}
+        cli = CLI(api_client=api, cache_manager=self.cache)
+
+        code, out = self.run_cli(cli, ["get", "user", "1"])
+
+        print("Test Case 27 Passed: get user fetched posts and users on the thread pool")
+        self.assertEqual(code, 0)
+        self.assertIn("Posts count: 2", out)
+        api.fetch_posts.assert_called_once_with(with_raw=True)
+        api.fetch_users.assert_called_once_with(with_raw=True)
+        self.assertEqual(self.cache.get_validators("posts"), {"etag": '"p1"'})
+
+    def test_case_28_async_batch_path_revalidates(self):
+        # a stale entry with an ETag for users, nothing cached for posts
+        with patch("src.cache_manager.time.monotonic", return_value=time.monotonic() - 120), \
+                patch("src.cache_manager.time.time", return_value=time.time() - 120):
+            self.cache.save("users", [dict(u) for u in USERS], etag='"u1"')
+
+        posts_raw = orjson.dumps(POSTS)
+        async_client = AsyncAPIClient(base_url="https://jsonplaceholder.typicode.com")
+
+        async def fake_fetch(path, etag=None, last_modified=None, with_raw=False):
+            if path == "/users":
+                raise NotModified(path)
+            async_client.validators["posts"] = {"etag": '"p1"'}
+            return [dict(p) for p in POSTS], posts_raw
+
+        cli = CLI(api_client=Mock(), cache_manager=self.cache, async_client=async_client)
+        with patch.object(async_client, "fetch", new=AsyncMock(side_effect=fake_fetch)) as mock_fetch:
+            code, out = self.run_cli(cli, ["get", "post", "3"])
+
+        print("Test Case 28 Passed: async batch path sent validators and cached responses")
+        self.assertEqual(code, 0)
+        self.assertIn("Author posts: 2", out)
+        mock_fetch.assert_any_await("/users", with_raw=True, etag='"u1"')
+        self.assertEqual([u["id"] for u in self.cache.load("users")], [1, 2])
+        self.assertEqual(self.cache.load_bytes("posts"), posts_raw)
+        self.assertEqual(self.cache.get_validators("posts"), {"etag": '"p1"'})
+
+    def test_case_36_async_batch_cancels_siblings_on_error(self):
+        async_client = AsyncAPIClient(base_url="https://jsonplaceholder.typicode.com")
+        cancelled = []
+
+        async def fake_fetch(path, etag=None, last_modified=None, with_raw=False):
+            if path == "/users":
+                raise APIClientError("Client error: 404")
+            try:
+                await asyncio.sleep(30)
+            except asyncio.CancelledError:
+                cancelled.append(path)
+                raise
+
+        cli = CLI(api_client=Mock(), cache_manager=self.cache, async_client=async_client)
+        with patch.object(async_client, "fetch", new=AsyncMock(side_effect=fake_fetch)):
+            code, out = self.run_cli(cli, ["get", "user", "1"])
+
+        print("Test Case 36 Passed: failed key cancelled the other fetch before the session closed")
+        self.assertEqual(code, 2)
+        self.assertIn("Client error: 404", out)
+        self.assertEqual(cancelled, ["/posts"])
+
+    def test_case_37_run_purges_expired_entries(self):
+        posts = [dict(p) for p in POSTS]
+
+        def fetch_posts(**kwargs):
+            # an entry that goes stale while the command runs (run() starts on an empty heap)
+            with patch("src.cache_manager.time.monotonic", return_value=time.monotonic() - 120):
+                self.cache.save("users", [dict(u) for u in USERS])
+            return posts, orjson.dumps(posts)
+
+        api = Mock()
+        api.fetch_posts.side_effect = fetch_posts
+        api.validators = {}
+        cli = CLI(api_client=api, cache_manager=self.cache)
+
+        code, _ = self.run_cli(cli, ["list", "posts"])
+
+        print("Test Case 37 Passed: expired in-memory entries purged after the command ran")
+        self.assertEqual(code, 0)
+        self.assertEqual(self.cache.stats()["in_memory_keys"], ["posts"])
+
+if __name__ == "__main__":
+    unittest.main()
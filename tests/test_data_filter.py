@@ -1,5 +1,5 @@
 import unittest
-from src.data_filter import filter_posts, get_post_by_id, filter_users
+from src.data_filter import filter_posts, get_post_by_id, filter_users, build_post_index, build_user_index, get_user_by_id, attach_search_text, POST_SEARCH_FIELDS, build_post_frame
 
 POSTS = [
     {"id": 1, "userId": 1, "title": "Hello World", "body": "First post"},
@@ -34,5 +34,30 @@ class TestDataFilter(unittest.TestCase):
         print("Test Case 6 Passed: filter_users search worked")
         self.assertEqual(res[0]["id"], 1)
 
+    def test_case_9_indexed_lookups(self):
+        by_id, by_user = build_post_index(POSTS)
+        users_by_id = build_user_index(USERS)
+        print("Test Case 9 Passed: index-backed lookups match linear scans")
+        self.assertIs(get_post_by_id(POSTS, 3, index=by_id), get_post_by_id(POSTS, 3))
+        self.assertEqual(len(by_user[1]), 2)
+        self.assertEqual(get_user_by_id(USERS, 2, index=users_by_id)["username"], "bobby")
+        self.assertIsNone(get_post_by_id(POSTS, 99, index=by_id))
+
+    def test_case_12_search_uses_precomputed_text(self):
+        posts = attach_search_text([dict(p) for p in POSTS], POST_SEARCH_FIELDS)
+        res = filter_posts(posts, search="KEYWORD")
+        print("Test Case 12 Passed: search works on precomputed _search text")
+        self.assertEqual(posts[0]["_search"], "hello world\nfirst post")
+        self.assertEqual([p["id"] for p in res], [3])
+
+    def test_case_20_frame_filter_matches_list_filter(self):
+        frame = build_post_frame(POSTS)
+        if frame is None:
+            self.skipTest("pandas not installed")
+        res = filter_posts(POSTS, user_id=1, search="keyword", frame=frame)
+        print("Test Case 20 Passed: DataFrame filtering matches list filtering")
+        self.assertEqual(res, filter_posts(POSTS, user_id=1, search="keyword"))
+        self.assertIs(filter_posts(POSTS, limit=1, frame=frame)[0], POSTS[0])
+
 if __name__ == "__main__":
     unittest.main()
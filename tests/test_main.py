@@ -0,0 +1,32 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+from main import AppConfig
+
+
+class TestAppConfig(unittest.TestCase):
+
+    def test_case_32_from_env_reads_env_file_from_base_dir(self):
+        with tempfile.TemporaryDirectory() as base_dir, tempfile.TemporaryDirectory() as other_dir:
+            with open(os.path.join(base_dir, ".env"), "w", encoding="utf-8") as fh:
+                fh.write("CACHE_TTL=42\nAPI_BASE=http://localhost:8000\n")
+            cwd = os.getcwd()
+            try:
+                os.chdir(other_dir)
+                with patch.dict(os.environ, {"LOG_LEVEL": "DEBUG"}, clear=True):
+                    config = AppConfig.from_env(base_dir=base_dir)
+            finally:
+                os.chdir(cwd)
+        print("Test Case 32 Passed: AppConfig read the env file next to main.py")
+        self.assertEqual(config, AppConfig(log_level="DEBUG", cache_dir="cache", cache_ttl=42, api_base="http://localhost:8000"))
+
+    def test_case_33_from_env_defaults_without_env_file(self):
+        with tempfile.TemporaryDirectory() as base_dir:
+            with patch.dict(os.environ, {}, clear=True):
+                config = AppConfig.from_env(base_dir=base_dir)
+        print("Test Case 33 Passed: AppConfig falls back to defaults")
+        self.assertEqual(config, AppConfig())
+
+if __name__ == "__main__":
+    unittest.main()